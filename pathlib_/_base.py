@@ -6,18 +6,94 @@ This submodule implements the basis of the protocol (abstract and base classes).
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from functools import cached_property, lru_cache
 from io import text_encoding as io_text_encoding
 from logging import getLogger
 from os import fspath
-from re import IGNORECASE as RE_IGNORECASE, NOFLAG as RE_NOFLAG, match as re_match
+from re import IGNORECASE as RE_IGNORECASE, NOFLAG as RE_NOFLAG, compile as re_compile
+from sys import intern
 
 from pathlib_.glob_ import translate as glob_translate
 
 __version__ = '0.1.0'
 
+GLOB_SPECIAL_CHARS = frozenset('*?[')
 JOINPATH_INSANE_BEHAVIOR = False
 LOGGER = getLogger(__name__)
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern, separator, recursive, flags):
+	"""Compile a glob pattern
+	Translate the glob-style pattern into a compiled regular expression. The same patterns are usually matched against a lot of paths, so both steps are memoized.
+
+	:param str pattern: The pattern, following the "pattern language"
+	:param str separator: The path separator for the pattern
+	:param bool recursive: If the recursive wildcard ("**") should match any number of segments
+	:param int flags: The regular expression flags
+	:return callable: The "match" method of the compiled expression
+	"""
+
+	return re_compile(glob_translate(pattern, recursive=recursive, include_hidden=True, seps=separator), flags=flags).match
+	
+
+class _PathParents(Sequence):
+	"""Lazy parents sequence
+	The logical ancestors of a path, from the closest to the furthest. Each parent is only built when it's requested, since most callers would only walk a few of them (if any).
+	"""
+	
+	__slots__ = ('_path',)
+	
+	def __contains__(self, value):
+		"""Contains magic
+		Paths compare as their underlying tuples, so when the tail needs no simplification a parent is just a prefix of the path and no parent instance has to be built.
+		"""
+		
+		path = self._path
+		if path.simplified_tail != path.tail:
+			return super().__contains__(value)
+		if not isinstance(value, tuple):
+			return False
+		return (bool(path.anchor) <= len(value) < len(path)) and (path[:len(value)] == value)
+	
+	def __getitem__(self, idx):
+		"""Get item magic
+		Build the requested parent(s). Slices yield a tuple of parents.
+		"""
+		
+		if isinstance(idx, slice):
+			return tuple(self[i] for i in range(*idx.indices(len(self))))
+		
+		length = len(self)
+		if idx < 0:
+			idx += length
+		if not (0 <= idx < length):
+			raise IndexError(idx)
+		path = self._path
+		return path._from_parsed_parts(path.drive, path.root, path.tail[:length - idx - 1])
+	
+	def __init__(self, path):
+		"""Initialization magic
+		Keep a reference to the path whose parents are going to be computed.
+		"""
+		
+		self._path = path
+	
+	def __len__(self):
+		"""Length magic
+		There's a parent for each component of the tail.
+		"""
+		
+		return len(self._path.tail)
 	
+	def __repr__(self):
+		"""Repr magic
+		Create a machine friendly representation of the object.
+		"""
+		
+		return "<{}.parents>".format(repr(self._path))
+
 
 class BasePurePath(tuple):
 	"""Base class for manipulating paths without I/O.
@@ -37,14 +113,24 @@ class BasePurePath(tuple):
 	INVALID_PATH_CHARS = frozenset()
 	INVALID_PATH_COMPONENTS = frozenset()
 	JOINPATH_INSANE_BEHAVIOR = JOINPATH_INSANE_BEHAVIOR
+	LOSSLESS_PARSING = False
 	SEPARATOR = '/'
 	SUFFIX_SEPARATOR = '.'
+	NAME_ATTRIBUTES = ('name', 'stem', 'suffix', 'pure_stem', 'suffixes')
+	PARENT_ATTRIBUTES = ('parent', 'parents')
+	LOCAL_PARSING = {
+		**dict.fromkeys(NAME_ATTRIBUTES, ('_parse_name', NAME_ATTRIBUTES)),
+		**dict.fromkeys(PARENT_ATTRIBUTES, ('_get_parents', PARENT_ATTRIBUTES)),
+	}
 
 	def __add__(self, other):
 		""""Addition" magic
 		Append other as a continuous part of the current path.
 		"""
 
+		if (type(other) is type(self)) and not other.anchor:
+			# Both sides are already parsed and valid, so the tails are just concatenated
+			return self._from_parsed_parts(self.drive, self.root, self.tail + other.tail)
 		try:
 			return self.joinpath(other)
 		except TypeError:
@@ -55,41 +141,7 @@ class BasePurePath(tuple):
 		Implementing the fspath protocol from PEP 519. Return the "simplified" version of the path (might differ from the original).
 		"""
 
-		try:
-			return self._fspath
-		except AttributeError:
-			if self.anchor:
-				fspath_value = self.anchor + self.SEPARATOR.join(self[1:])
-			else:
-				fspath_value = self.SEPARATOR.join(self)
-			fspath_value.encode('unicode-escape').decode()
-			self._fspath = fspath_value
-			return self._fspath
-
-	def __getattr__(self, name):
-		"""Lazy attribute resolution
-		Avoid some processing until is actually needed.
-		"""
-		
-		if name == '_basic_str':
-			value = ((self.anchor if self.anchor else '') + self.SEPARATOR.join(self.tail))
-			value.encode('unicode-escape').decode()
-		elif name == '_pattern_str':
-			value = self._basic_str
-		else:
-			for attribute_names, resolver_callable in self.LOCAL_PARSING.items():
-				if name in attribute_names:
-					results = resolver_callable(self)
-					for i in range(len(attribute_names)):
-						self.__setattr__(attribute_names[i], results[i])
-						if name == attribute_names[i]:
-							result = results[i]
-					return result
-	
-			raise AttributeError(name)
-		
-		self.__setattr__(name, value)
-		return value
+		return self._fspath
 
 	def __new__(cls, *args, drive=None, root=None, tail=None):
 		"""Creation magic
@@ -98,42 +150,63 @@ class BasePurePath(tuple):
 		The drive/root/tail keyword parameters can be used to avoid the usually expensive path parsing logic.
 		"""
 
+		basic_str = None
 		if (drive is not None) or (root is not None) or (tail is not None):
 			if (drive is None) or (root is None) or (tail is None):
 				raise ValueError("When using drive/root/tail value to build path you must provide the three of them.")
 			if args:
 				LOGGER.warning('Using drive/root/tail to build path; Ignoring provided paths: %s', args)
 			drive, root, tail = drive, root, tail
+		elif not args:
+			return cls._from_parsed_parts('', '', ())
+		elif (len(args) == 1) and isinstance(args[0], str):
+			# The most common case, a single string, doesn't need the joining logic
+			drive, root, tail = cls._parse_path(args[0])
+			if cls.LOSSLESS_PARSING and (type(args[0]) is str):
+				# Joining the parsed parts back would yield this very string (subclasses are left out, str() has to hand back a plain string)
+				basic_str = args[0]
+		elif (len(args) == 1) and (type(args[0]) is cls):
+			# Paths are immutable, an instance of this very class can stand for itself
+			return args[0]
 		else:
-			paths = []
+			drive, root, tail = '', '', ()
 			for arg in args:
 				if isinstance(arg, cls):
-					paths.extend(list(arg))
+					# Already parsed, so its components are spliced in directly instead of going through a string again
+					other = arg.drive, arg.root, arg.tail
 				else:
-					try:
-						path = fspath(arg)
-					except TypeError:
+					if type(arg) is str:
+						# By far the most common argument, fspath would just hand it back
 						path = arg
-					if not isinstance(path, str):
-						raise TypeError(f"argument should be a str or an os.PathLike object where __fspath__ returns a str, not {type(path).__name__!r}")
-					paths.append(path)
+					else:
+						try:
+							path = fspath(arg)
+						except TypeError:
+							path = arg
+						if not isinstance(path, str):
+							raise TypeError(f"argument should be a str or an os.PathLike object where __fspath__ returns a str, not {type(path).__name__!r}")
+					if not path:
+						# Empty strings add nothing to the path
+						continue
+					# Each segment is parsed on its own (the parsing is memoized), there's no point in joining them just to split them again
+					other = cls._parse_path(path)
+				drive, root, tail = cls._join_parsed_parts(drive, root, tail, *other)
 
-			drive, root, tail = cls._parse_path(cls.SEPARATOR.join(paths))
+		if not (drive or root or tail):
+			return cls._from_parsed_parts('', '', ())
 
-		anchor = drive + root
-		parts = ([anchor] if anchor else []) + [part for part in tail]
-		cls._validate_parts(anchor, *tail)
-		simplified_tail = cls._simplify_tail(anchor, *tail)
+		cls._validate_parts(drive + root, *tail)
 
-		path = super().__new__(cls, ([anchor] if anchor else []) + simplified_tail)
+		return cls._from_parsed_parts(drive, root, tail, basic_str)
 
-		path.parts, path.drive, path.root, path.anchor, path.tail, path.simplified_tail = tuple(parts), drive, root, anchor, tuple(tail), tuple(simplified_tail)
-		path.LOCAL_PARSING = {
-			('name', 'stem', 'suffix', 'pure_stem', 'suffixes') : path._parse_name,
-			('parent', 'parents') : path._get_parents,
-		}
+	def __reduce__(self):
+		"""Pickle magic
+		Rebuild the path from its plain string instead of the default tuple reduction (which the constructor can't take back). The string parsing is cached, so unpickling is cheap.
 
-		return path
+		:return tuple: the class and the constructor arguments
+		"""
+
+		return self.__class__, (self._basic_str,)
 
 	def __repr__(self):
 		"""Repr magic
@@ -148,7 +221,8 @@ class BasePurePath(tuple):
 		"""
 
 		try:
-			return self.convert_path(other) + self
+			# The left hand side couldn't handle it, so it's built as this class and joined directly (no operator round-trip)
+			return type(self)(other).joinpath(self)
 		except TypeError:
 			return NotImplemented
 
@@ -158,86 +232,243 @@ class BasePurePath(tuple):
 		"""
 
 		try:
-			return self.convert_path(other) / self
+			# The left hand side couldn't handle it, so it's built as this class and joined directly (no operator round-trip)
+			return type(self)(other).joinpath(self)
 		except TypeError:
 			return NotImplemented
 
 	def __str__(self):
 		"""String magic
-		Using a default behavior here. This method usually gets replaced that's why the default behavior implementation lives in "_true_str".
+		Using a default behavior here. This method usually gets replaced that's why the default behavior implementation lives in "_basic_str" (computed when the instance is created).
 		
 		:return str: this path as a string
 		"""
 		
-		try:
-			return self._str
-		except AttributeError:
-			self._str = self._basic_str
-			return self._str
+		return self._basic_str
 
 	def __truediv__(self, other):
 		""""Division" magic
 		Append other as a continuous part of the current path.
 		"""
 
+		if (type(other) is type(self)) and not other.anchor:
+			# Both sides are already parsed and valid, so the tails are just concatenated
+			return self._from_parsed_parts(self.drive, self.root, self.tail + other.tail)
 		try:
 			return self.joinpath(other)
 		except TypeError:
 			return NotImplemented
 
+	def _load_local_parsing(self, name):
+		"""Lazy attribute resolution
+		Avoid some processing until is actually needed. The resolver for the attribute is looked up in the class level LOCAL_PARSING table and all the attributes it produces are cached at once, so accessing the siblings is free afterwards.
+		
+		:param str name: the attribute being requested
+		:return: the value for the requested attribute
+		"""
+		
+		resolver_name, attribute_names = self.LOCAL_PARSING[name]
+		self.__dict__.update(zip(attribute_names, getattr(self, resolver_name)(self)))
+		return self.__dict__[name]
+	
+	@cached_property
+	def name(self):
+		"""Name
+		The final component of the path (or some special case value). Computed by "_parse_name".
+		"""
+		
+		return self._load_local_parsing('name')
+	
+	@cached_property
+	def parent(self):
+		"""Parent
+		The logical parent of the path. Computed by "_get_parents".
+		"""
+		
+		return self._load_local_parsing('parent')
+	
+	@cached_property
+	def parents(self):
+		"""Parents
+		The logical ancestors of the path, from the closest to the furthest. Computed by "_get_parents".
+		"""
+		
+		return self._load_local_parsing('parents')
+	
+	@cached_property
+	def pure_stem(self):
+		"""Pure stem
+		The final path component without any of its suffixes. Computed by "_parse_name".
+		"""
+		
+		return self._load_local_parsing('pure_stem')
+	
+	@cached_property
+	def stem(self):
+		"""Stem
+		The final path component without its last suffix. Computed by "_parse_name".
+		"""
+		
+		return self._load_local_parsing('stem')
+	
+	@cached_property
+	def suffix(self):
+		"""Suffix
+		The last extension of the final component, if any. Computed by "_parse_name".
+		"""
+		
+		return self._load_local_parsing('suffix')
+	
+	@cached_property
+	def suffixes(self):
+		"""Suffixes
+		A list of the final component's extensions. Computed by "_parse_name".
+		"""
+		
+		return self._load_local_parsing('suffixes')
+	
+	@property
+	def _pattern_str(self):
+		"""Pattern string
+		The string used on both sides of the pattern matching logic. It defaults to the basic string version of the path.
+		
+		:return str: this path as a string suitable for pattern matching
+		"""
+		
+		return self._basic_str
+	
 	@staticmethod
 	def _get_parents(path_instance):
 		"""Get the parents of a certain path instance
 		The default implementation should work for most cases. Child classes can override it for custom behavior. New implementations should have the same signature and return the same structure.
 		
 		:param path_instance: the Path instance to get the parents from
-		:return: currently a tuple of ('parent', 'parents') where parent is the direct parent and parents is the list from the closest to the furthest parent in the tree (as a tuple). The current expected result is the matching key on the cls.LOCAL_PARSING dictionary.
+		:return: currently a tuple of ('parent', 'parents') where parent is the direct parent and parents is a lazy sequence from the closest to the furthest parent in the tree. The current expected result is the matching entry on the cls.LOCAL_PARSING dictionary.
 		"""
 		
-		cls = type(path_instance)
-		parent, parents = path_instance, []
-		if path_instance.tail:
-			for i in range(len(path_instance.tail) - 1, 0, -1):
-				parents.append(cls(drive=path_instance.drive, root=path_instance.root, tail=path_instance.tail[:i]))
-			if path_instance.anchor:
-				parents.append(cls(drive=path_instance.drive, root=path_instance.root, tail=[]))
-			else:
-				parents.append(cls())
-			if len(parents):
-				parent = parents[0]
+		parents = _PathParents(path_instance)
+		return (parents[0] if parents else path_instance), parents
 
-		return parent, tuple(parents)
+	@classmethod
+	def _from_parsed_parts(cls, drive, root, tail, basic_str=None):
+		"""Build from parsed parts
+		Low level constructor for components that are known to be valid already (slices of an existing path, for example), so the parsing and validation logic is skipped. The tail is still simplified.
+		
+		:param drive: the drive of the new path
+		:param root: the root of the new path
+		:param tail: the tail of the new path
+		:param str? basic_str: the string that the components join into, when the caller already has it
+		:return cls: a new instance of this class with the provided components
+		"""
+		
+		# Concatenating with an empty string already hands back the other (shared) object, only the drive plus root anchors need interning
+		anchor = intern(drive + root) if (drive and root) else (drive or root)
+		tail = tuple(tail)
+		if not (anchor or tail):
+			# The empty path is immutable (and very common, it's the furthest parent of every relative path), so a single instance per class is shared. It's kept in the class's own __dict__ so subclasses get their own.
+			try:
+				return cls.__dict__['_empty_path']
+			except KeyError:
+				pass
+		simplified_tail = tuple(cls._simplify_tail(anchor, *tail))
+		anchor_part = (anchor,) if anchor else ()
+		parts = anchor_part + tail
+
+		path = super().__new__(cls, parts if simplified_tail == tail else (anchor_part + simplified_tail))
+
+		path.parts, path.drive, path.root, path.anchor, path.tail, path.simplified_tail = parts, drive, root, anchor, tail, simplified_tail
+		# Paths are immutable, so the string versions are built once, right here, instead of lazily on first use
+		if basic_str is None:
+			basic_str = (anchor + cls.SEPARATOR.join(tail)) if tail else anchor
+		path._basic_str = basic_str
+		if simplified_tail == tail:
+			path._fspath = path._basic_str
+		else:
+			path._fspath = (anchor + cls.SEPARATOR.join(simplified_tail)) if simplified_tail else anchor
+		if not (anchor or tail):
+			cls._empty_path = path
 
+		return path
+	
+	@classmethod
+	def _join_parsed_parts(cls, drive, root, tail, other_drive, other_root, other_tail):
+		"""Join parsed parts
+		Append the already parsed "other" components to the current ones. A different drive replaces the current components, a root (without a drive) restarts from the current drive, and the same drive alone (a drive relative path) just appends. Drives are compared case-insensitively when the class isn't CASE_SENSITIVE, keeping the latest spelling. A UNC drive gets its root once there's a tail after it.
+		
+		:param drive: the current drive
+		:param root: the current root
+		:param tail: the current tail
+		:param other_drive: the drive of the components to append
+		:param other_root: the root of the components to append
+		:param other_tail: the tail of the components to append
+		:return: a tuple (drive, root, tail) with the combined components
+		"""
+		
+		if other_drive:
+			if (not hasattr(cls, 'CASE_SENSITIVE')) or cls.CASE_SENSITIVE:
+				different_drive = other_drive != drive
+			else:
+				different_drive = other_drive.lower() != drive.lower()
+			if different_drive:
+				return other_drive, other_root, tuple(other_tail)
+			# Same drive, but the latest spelling wins (like ntpath.join)
+			drive = other_drive
+		if other_root:
+			return drive, other_root, tuple(other_tail)
+		tail = tuple(tail) + tuple(other_tail)
+		if tail and drive.startswith(cls.SEPARATOR) and not root:
+			# A UNC (or namespace) drive is always absolute, the components go after its root instead of being glued to the share
+			root = cls.SEPARATOR
+		return drive, root, tail
+	
 	@staticmethod
 	def _parse_name(path_instance):
 		"""Local name parsing logic
 		This implementation should work for most cases.Child classes could still override it for custom behavior. New implementations should have the same signature and return the same structure.
 		
 		:param path_instance: the Path instance to get the name (and other values) for
-		:return: currently a tuple of ('name', 'stem', 'suffix', 'pure_stem', 'suffixes') where name is the final component of the path (or some special case value), stem + suffix = name, and pure_stem + ''.join(suffixes) = name. The up-to-date expected result structure can be found in the matching key on the cls.LOCAL_PARSING dictionary.
+		:return: currently a tuple of ('name', 'stem', 'suffix', 'pure_stem', 'suffixes') where name is the final component of the path (or some special case value), stem + suffix = name, and pure_stem + ''.join(suffixes) = name. The up-to-date expected result structure can be found in the matching entry on the cls.LOCAL_PARSING dictionary.
 		"""
 
-		name = path_instance.tail[-1] if path_instance.tail else ''
-		if (not name) or name.endswith(path_instance.SUFFIX_SEPARATOR):
-			suffixes = []
-		else:
-			suffixes = [path_instance.SUFFIX_SEPARATOR + suffix for suffix in name.lstrip(path_instance.SUFFIX_SEPARATOR).split(path_instance.SUFFIX_SEPARATOR)[1:]]
-		suffix = suffixes[-1] if suffixes else ''
-		stem = name[:-len(suffix)] if suffix else name
+		tail, suffix_separator = path_instance.tail, path_instance.SUFFIX_SEPARATOR
+		name = tail[-1] if tail else ''
+		if (suffix_separator not in name) or name.endswith(suffix_separator):
+			return name, name, '', name, []
+		
+		# Leading separators are part of the stem (hidden files), the first separator after them starts the suffixes
+		first = name.find(suffix_separator, len(name) - len(name.lstrip(suffix_separator)))
+		if first < 0:
+			return name, name, '', name, []
+		
+		last = name.rfind(suffix_separator)
+		suffix = name[last:]
 		# New Attribute
-		pure_stem = name[:-len(''.join(suffixes))] if suffixes else name
+		pure_stem = name[:first]
+		suffixes = [suffix] if first == last else [suffix_separator + extension for extension in name[first + 1:].split(suffix_separator)]
 
-		return name, stem, suffix, pure_stem, suffixes
+		return name, name[:last], suffix, pure_stem, suffixes
 
+	@classmethod
+	def _split_tail(cls, tail):
+		"""Split the tail
+		Break the non-anchor section of a path string into its components. The empty string yields no components at all, instead of a single empty one. The components are interned, so sibling paths share their common components.
+		
+		:param str tail: the section of the path string after the anchor
+		:return tuple: the components of that section
+		"""
+		
+		return tuple(map(intern, tail.split(cls.SEPARATOR))) if tail else ()
+	
 	@classmethod
 	def _parse_path(cls, path):
 		"""Local parsing logic
 		Should implement whatever logic is needed to parse the provided path string into a tuple (drive, root, tail)
 
 		The method should not try to simplify the path (resolve globbing, remove separator repetitions, etc.). The class must be able to recreate the original values, which becomes impossible if any part of it is removed here.
+		The result should be immutable (the tail a tuple), so implementations can be memoized with functools.lru_cache.
 		
 		:param path: the "path" provided to build the instance. Should be a string or better.
-		:return: a tuple (drive, root, tail) where the empty result would be ('', '', []). The drive and root values are the "sections" of the anchor, and tail is a list containing all the other "parts" for the path.
+		:return: a tuple (drive, root, tail) where the empty result would be ('', '', ()). The drive and root values are the "sections" of the anchor, and tail is a tuple containing all the other "parts" for the path.
 		"""
 
 		raise NotImplementedError('_parse_path()')
@@ -251,10 +482,10 @@ class BasePurePath(tuple):
 		The default is a passthrough (do nothing).
 		
 		:param tail: the tail of the Path to simplify
-		:return: simplified version of the provided tail
+		:return: simplified version of the provided tail (as a tuple)
 		"""
 		
-		return list(tail)
+		return tail
 
 	@classmethod
 	def _validate_parts(cls, anchor='', *tail):
@@ -268,12 +499,14 @@ class BasePurePath(tuple):
 		if not tail:
 			return True
 
-		if invalid_component := frozenset(tail) & cls.INVALID_PATH_COMPONENTS:
-			raise ValueError('Invalid path component: {}'.format(invalid_component))
+		# The sets are only built when there's an actual error to report, isdisjoint does the checks without any intermediate set
+		if not cls.INVALID_PATH_COMPONENTS.isdisjoint(tail):
+			raise ValueError('Invalid path component: {}'.format(frozenset(tail) & cls.INVALID_PATH_COMPONENTS))
 		
+		separator, invalid_path_chars = cls.SEPARATOR, cls.INVALID_PATH_CHARS
 		for part in tail:
-			if invalid_chars := frozenset(part) & (cls.INVALID_PATH_CHARS | frozenset(cls.SEPARATOR)):
-				raise ValueError('Invalid character(s) in path component: "{}" -> {}'.format(invalid_chars, part))
+			if (separator in part) or not invalid_path_chars.isdisjoint(part):
+				raise ValueError('Invalid character(s) in path component: "{}" -> {}'.format(frozenset(part) & (invalid_path_chars | frozenset(separator)), part))
 
 		return True
 
@@ -304,7 +537,8 @@ class BasePurePath(tuple):
 		"""
 		
 		other = self.convert_path(other)
-		return other == self or other in self.parents
+		# Paths compare as their underlying tuples, so being relative to "other" means starting with it (an anchored path is never relative to the empty path)
+		return (bool(self.anchor) <= len(other) <= len(self)) and (self[:len(other)] == other)
 	
 	def joinpath(self, *pathsegments):
 		"""Join path
@@ -317,21 +551,36 @@ class BasePurePath(tuple):
 		:return type(self): A new instance of this type of path with the extra segments appended
 		"""
 		
-		drive, root, tail = self.drive, self.root, list(self.tail)
+		cls, separator, drive, root, tail = type(self), self.SEPARATOR, self.drive, self.root, self.tail
 		for path in pathsegments:
-			path = self.convert_path(path)
+			# Same thing convert_path would do, inlined to save a call per segment
+			if not isinstance(path, cls):
+				if isinstance(path, str):
+					if not path:
+						continue
+					# The parsing is memoized, and an unanchored segment only needs its components validated (no intermediate instance). They end up under the current anchor, so they're validated against it.
+					other_drive, other_root, other_tail = cls._parse_path(path)
+					if not (other_drive or other_root):
+						self._validate_parts(drive + root, *other_tail)
+						tail += other_tail
+						continue
+				path = cls(path)
 			if path.anchor:
 				if self.JOINPATH_INSANE_BEHAVIOR:
 					if (path.drive == self.drive) and not path.root:
-						tail.extend(list(path.tail))
+						tail += path.tail
 					else:
-						drive, root, tail = path.drive, path.root, list(path.tail)
+						drive, root, tail = path.drive, path.root, path.tail
 				else:
 					raise ValueError("Can't join an anchored path")
 			else:
-				tail.extend(list(path.tail))
+				tail += path.tail
 		
-		return self.__class__(drive=drive, root=root, tail=tail)
+		if tail and drive.startswith(separator) and not root:
+			# Same as _join_parsed_parts, a UNC (or namespace) drive gets its root once there's something after it
+			root = separator
+		# Every segment was either validated or parsed into a path instance, so all the components are valid already
+		return self._from_parsed_parts(drive, root, tail)
 	
 	def full_match(self, pattern, *, case_sensitive=None):
 		"""Globbing with the pattern language
@@ -359,8 +608,11 @@ class BasePurePath(tuple):
 		flags = RE_IGNORECASE if (case_sensitive is not None) and not case_sensitive else RE_NOFLAG
 		
 		if recursive:
-			regex = glob_translate(pattern._pattern_str, recursive=True, include_hidden=True, seps=pattern.SEPARATOR)
-			return re_match(regex, self._pattern_str, flags=flags) is not None
+			pattern_str = pattern._pattern_str
+			if (flags == RE_NOFLAG) and GLOB_SPECIAL_CHARS.isdisjoint(pattern_str):
+				# A literal pattern translates into its own escaped string, so the regular expression is just a string comparison
+				return self._pattern_str == pattern_str
+			return _compile_pattern(pattern_str, pattern.SEPARATOR, True, flags)(self._pattern_str) is not None
 		
 		reverse_pattern_parts, reverse_path_parts = pattern.parts[::-1], self.parts[::-1]
 		
@@ -372,8 +624,11 @@ class BasePurePath(tuple):
 			return False
 		
 		for path_part, pattern_part in zip(reverse_path_parts, reverse_pattern_parts):
-			regex = glob_translate(str(pattern_part), recursive=False, include_hidden=True, seps=pattern.SEPARATOR)
-			if re_match(regex, path_part, flags=flags) is None:
+			if (flags == RE_NOFLAG) and GLOB_SPECIAL_CHARS.isdisjoint(pattern_part):
+				# A literal part (the usual case for the name or the directories) needs no regular expression
+				if path_part != pattern_part:
+					return False
+			elif _compile_pattern(pattern_part, pattern.SEPARATOR, False, flags)(path_part) is None:
 				return False
 		return True
 
@@ -393,7 +648,7 @@ class BasePurePath(tuple):
 		if not self.is_relative_to(other):
 			raise ValueError(f"{str(self)!r} is not in the subpath of {str(other)!r}")
 
-		return self.__class__(drive='', root='', tail=self.tail[len(other.tail):])
+		return self._from_parsed_parts('', '', self.tail[len(other.tail):])
 
 	def with_name(self, name):
 		"""Different name
@@ -403,7 +658,9 @@ class BasePurePath(tuple):
 		:return type(self): A new instance of this type of path with the new name
 		"""
 
-		return self.__class__(drive=self.drive, root=self.root, tail=(self.tail[:-1] + (name,)))
+		# Only the new name needs validation, the rest of the components come from this (valid) path
+		self._validate_parts(self.anchor, name)
+		return self._from_parsed_parts(self.drive, self.root, self.tail[:-1] + (name,))
 	
 	def with_stem(self, stem):
 		"""Different stem
@@ -426,9 +683,10 @@ class BasePurePath(tuple):
 		:return type(self): A new instance of this type of path with the new pure_stem
 		"""
 
-		if (not pure_stem) or (pure_stem[-1] == self.SUFFIX_SEPARATOR):
+		suffix_separator = self.SUFFIX_SEPARATOR
+		if (not pure_stem) or (pure_stem[-1] == suffix_separator):
 			raise ValueError('Invalid pure_stem "{}"'.format(pure_stem))
-		if self.SUFFIX_SEPARATOR in pure_stem.lstrip(self.SUFFIX_SEPARATOR):
+		if suffix_separator in pure_stem.lstrip(suffix_separator):
 			raise ValueError('Provided pure_stem is not pure, it contains suffixes "{}"'.format(pure_stem))
 		return self.with_name(pure_stem + ''.join(self.suffixes))
 	
@@ -454,8 +712,9 @@ class BasePurePath(tuple):
 		:return type(self): A new instance of this type of path with the new suffixes
 		"""
 		
+		suffix_separator = self.SUFFIX_SEPARATOR
 		for suffix in suffixes:
-			if not suffix.startswith(self.SUFFIX_SEPARATOR) or suffix == self.SUFFIX_SEPARATOR:
+			if not suffix.startswith(suffix_separator) or suffix == suffix_separator:
 				raise ValueError('Invalid suffix {}'.format(suffix))
 		return self.with_name(self.pure_stem + ''.join(suffixes))
 	
@@ -502,7 +761,8 @@ class BasePath(ABC):
 		:return bool: True if the path contains one of the special names reserved by the system, or is a reserved relative path, or is a reserved absolute path
 		"""
 		
-		return (self.name in self.RESERVED_NAMES) or (self in self.RESERVED_RELATIVE_PATHS) or (self.resolve() in self.RESERVED_ABSOLUTE_PATHS)
+		# Resolving means I/O, so it's skipped when there are no reserved absolute paths to compare with (the usual case)
+		return (self.name in self.RESERVED_NAMES) or (self in self.RESERVED_RELATIVE_PATHS) or (bool(self.RESERVED_ABSOLUTE_PATHS) and (self.resolve() in self.RESERVED_ABSOLUTE_PATHS))
 	
 	## Parsing and generating URIs ##
 	
@@ -602,7 +862,6 @@ class BasePath(ABC):
 
 		raise NotImplementedError('stat')
 
-	@abstractmethod
 	def lstat(self):
 		"""
 		Like stat(), except if the path points to a symlink, the symlink's status information is returned, rather than its target's.
@@ -702,7 +961,9 @@ class BasePath(ABC):
 		Open the file in text mode, read it, and close the file.
 		"""
 
-		encoding = io_text_encoding(encoding)
+		if encoding is None:
+			# An explicit encoding is returned untouched by text_encoding, only the default needs resolving
+			encoding = io_text_encoding(encoding)
 		with self.open(mode='r', encoding=encoding, errors=errors, newline=newline) as f:
 			return f.read()
 
@@ -721,7 +982,8 @@ class BasePath(ABC):
 
 		if not isinstance(data, str):
 			raise TypeError('data must be str, not %s' % data.__class__.__name__)
-		encoding = io_text_encoding(encoding)
+		if encoding is None:
+			encoding = io_text_encoding(encoding)
 		with self.open(mode='w', encoding=encoding, errors=errors, newline=newline) as f:
 			return f.write(data)
 
@@ -730,7 +992,8 @@ class BasePath(ABC):
 		Open the file in bytes mode, write to it, and close the file.
 		"""
 
-		view = memoryview(data)
+		# Any buffer is accepted, but bytes and bytearray can be written as they are (no need for the view)
+		view = data if isinstance(data, (bytes, bytearray)) else memoryview(data)
 		with self.open(mode='wb') as f:
 			return f.write(view)
 
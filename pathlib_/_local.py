@@ -31,11 +31,7 @@ class BaseOSPurePath(BasePurePath):
 		:return str: this path as a string
 		"""
 
-		try:
-			return self._str
-		except AttributeError:
-			self._str = self._basic_str if self._basic_str else self.CURRENT_DIRECTORY_ENTRY
-			return self._str
+		return self._basic_str or self.CURRENT_DIRECTORY_ENTRY
 	
 	def relative_to(self, other, walk_up=False):
 		"""Relative to "other" path
@@ -49,19 +45,21 @@ class BaseOSPurePath(BasePurePath):
 		other = self.convert_path(other)
 		if self.is_relative_to(other):
 			new_tail = self.tail[len(other.tail):]
+		elif walk_up and (self.anchor == other.anchor):
+			# The closest common ancestor is the common prefix of both tails, no parent instances are needed
+			self_tail, other_tail = self.tail, other.tail
+			common = next((i for i, (self_part, other_part) in enumerate(zip(self_tail, other_tail)) if self_part != other_part), min(len(self_tail), len(other_tail)))
+			if self.PARENT_DIRECTORY_ENTRY in other_tail[common:]:
+				raise ValueError(f"{str(other)!r} can't be walked up from, it moves upwards after the common ancestor")
+			# The parser keeps the empty and "." components, they aren't directories to walk up from
+			levels = sum(1 for other_part in other_tail[common:] if other_part not in ('', self.CURRENT_DIRECTORY_ENTRY))
+			new_tail = (self.PARENT_DIRECTORY_ENTRY,) * levels + self_tail[common:]
+		elif walk_up:
+			raise ValueError(f"{str(self)!r} is not related to {str(other)!r}")
 		else:
-			if walk_up:
-				new_tail = None
-				for i in range(len(other.parents)):
-					if other.parents[i] in self.parents:
-						new_tail = (self.PARENT_DIRECTORY_ENTRY,) * (i + 1) + self.relative_to(other.parents[i]).tail
-						break
-				if new_tail is None:
-					raise ValueError(f"{str(self)!r} is not related to {str(other)!r}")
-			else:
-				raise ValueError(f"{str(self)!r} is not a subpath of {str(other)!r}")
+			raise ValueError(f"{str(self)!r} is not a subpath of {str(other)!r}")
 		
-		return self.__class__(drive='', root='', tail=new_tail)
+		return self._from_parsed_parts('', '', new_tail)
 
 
 class BaseOSPath(BasePath):
@@ -77,13 +75,11 @@ class BaseOSPath(BasePath):
 		Forward a call to a function in the os module
 		"""
 
-		if hasattr(os, function):
-			if call_it:
-				return getattr(os, function)(*args, **kwargs)
-			else:
-				return getattr(os, function)
-		else:
+		# A single lookup, the missing case is the rare one
+		attribute = getattr(os, function, None)
+		if attribute is None:
 			raise NotImplementedError('The current "os" module does not contain the required function "{}"'.format(function))
+		return attribute(*args, **kwargs) if call_it else attribute
 	
 	@classmethod    
 	def _get_stat_attr(cls, function, *args, call_it=True, **kwargs):
@@ -91,13 +87,11 @@ class BaseOSPath(BasePath):
 		Forward a call to a function in the stat module
 		"""
 
-		if hasattr(stat, function):
-			if call_it:
-				return getattr(stat, function)(*args, **kwargs)
-			else:
-				return getattr(stat, function)
-		else:
+		# A single lookup, the missing case is the rare one
+		attribute = getattr(stat, function, None)
+		if attribute is None:
 			raise NotImplementedError('The current "stat" module does not contain the required function "{}"'.format(function))
+		return attribute(*args, **kwargs) if call_it else attribute
 
 
 	def _get_pathmod_attr(self, function, *args, call_it=True, **kwargs):
@@ -161,12 +155,6 @@ class BaseOSPath(BasePath):
 
 		return self._get_os_attr('stat', self, follow_symlinks=follow_symlinks)
 	
-	def lstat(self):
-		"""Return the result of the stat() system call on this path, like os.stat() does.
-		"""
-		
-		return self.stat(follow_symlinks=False)
-
 	def exists(self, *, follow_symlinks=True):
 		""" Whether this path exists.
 		This method normally follows symlinks; to check whether a symlink exists, add the argument follow_symlinks=False.
@@ -201,35 +189,28 @@ class BaseOSPath(BasePath):
 		"""
 
 		try:
-			return self._get_stat_attr('S_ISLNK', self.stat().st_mode)
+			return self._get_stat_attr('S_ISLNK', self.lstat().st_mode)
 		except (OSError, ValueError):
 			return False
 	
-	def is_symlink(self):
-		"""Whether this path is a symbolic link.
-		"""
-		
-		raise NotImplementedError('is_symlink')
-	
 	def is_mount(self):
 		"""Check if this path is a mount point
 		"""
 
-		# Need to exist and be a dir
-		if not self.exists() or not self.is_dir():
+		# Need to exist and be a dir. Each stat result is fetched once and reused
+		try:
+			path_stat = self.stat()
+		except (OSError, ValueError):
+			return False
+		if not self._get_stat_attr('S_ISDIR', path_stat.st_mode):
 			return False
 
 		try:
-			parent_dev = self.parent.stat().st_dev
+			parent_stat = self.parent.stat()
 		except OSError:
 			return False
 
-		dev = self.stat().st_dev
-		if dev != parent_dev:
-			return True
-		ino = self.stat().st_ino
-		parent_ino = self.parent.stat().st_ino
-		return ino == parent_ino
+		return (path_stat.st_dev != parent_stat.st_dev) or (path_stat.st_ino == parent_stat.st_ino)
 
 	def is_socket(self):
 		"""Whether this path is a socket.
@@ -282,19 +263,22 @@ class BaseOSPath(BasePath):
 		Open the file pointed by this path and return a file object, as the built-in open() function does.
 		"""
 
-		if "b" not in mode:
+		if (encoding is None) and ("b" not in mode):
 			encoding = io_text_encoding(encoding)
 		return io_open(self, mode, buffering, encoding, errors, newline)
 	
 	## Reading directories ##
 	
-	@abstractmethod
 	def iterdir(self):
 		"""Yield path objects of the directory contents.
 		The children are yielded in arbitrary order, and the special entries '.' and '..' are not included.
 		"""
 
-		raise NotImplementedError('iterdir')
+		drive, root, tail = self.drive, self.root, self.tail
+		# The entry names are single valid components, so the children are built from the parsed parts directly
+		with self._get_os_attr('scandir', str(self)) as entries:
+			for entry in entries:
+				yield self._from_parsed_parts(drive, root, tail + (entry.name,))
 
 	@abstractmethod
 	def glob(self, pattern, *, case_sensitive=None):
@@ -310,12 +294,48 @@ class BaseOSPath(BasePath):
 
 		raise NotImplementedError('rglob')
 
-	@abstractmethod
 	def walk(self, top_down=True, on_error=None, follow_symlinks=False):
 		"""Walk the directory tree from this directory, similar to os.walk().
+		Each directory is read with a single scandir, the entry type comes from the directory listing (no stat per entry on most platforms).
 		"""
 
-		raise NotImplementedError('walk')
+		stack = [self]
+		while stack:
+			path = stack.pop()
+			if isinstance(path, list):
+				# A directory whose children were already walked (bottom-up)
+				yield tuple(path)
+				continue
+
+			try:
+				entries = self._get_os_attr('scandir', str(path))
+			except OSError as error:
+				if on_error is not None:
+					on_error(error)
+				continue
+
+			drive, root, tail = path.drive, path.root, path.tail
+			dirnames, filenames, dirpaths = [], [], []
+			with entries:
+				for entry in entries:
+					try:
+						is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+					except OSError:
+						is_dir = False
+					if is_dir:
+						dirnames.append(entry.name)
+						if not top_down:
+							dirpaths.append(path._from_parsed_parts(drive, root, tail + (entry.name,)))
+					else:
+						filenames.append(entry.name)
+
+			if top_down:
+				yield path, dirnames, filenames
+				# The caller could have pruned dirnames in place
+				stack += [path._from_parsed_parts(drive, root, tail + (name,)) for name in reversed(dirnames)]
+			else:
+				stack.append([path, dirnames, filenames])
+				stack += reversed(dirpaths)
 		
 	## Creating files and directories ##
 
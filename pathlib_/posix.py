@@ -6,8 +6,12 @@ This submodule contains the specifics for POSIX systems.
 """
 
 from abc import abstractmethod
+from functools import lru_cache
 from logging import getLogger
+from os import fsencode
 import posixpath
+from sys import intern
+from urllib.parse import quote_from_bytes
 
 from ._local import __version__, BaseOSPath, BaseOSPurePath
 
@@ -19,34 +23,57 @@ class PurePosixPath(BaseOSPurePath):
 	
 	"""
 	
+	LOSSLESS_PARSING = True
 	parser = posixpath
 	
 	@classmethod
+	@lru_cache(maxsize=1024)
 	def _parse_path(cls, path):
 		"""Local parsing logic
 		Should implement whatever logic is needed to parse the provided path string into a tuple (drive, root, tail)
 
 		Drive and/or root could be empty, but both should be strings. Tail should be a sequence (could be empty too).
-		The empty path would yield ('', '', [])
+		The empty path would yield ('', '', ())
 
 		The method should not try to simplify the path (resolve globbing, remove separator repetitions, etc.). The class must be able to recreate the original values, which becomes impossible if any part of it is removed here.
 		"""
 
+		separator = cls.SEPARATOR
 		if path:
-			if path[0] == cls.SEPARATOR:
-				if (path[1:2] == cls.SEPARATOR) and (path[2:3] != cls.SEPARATOR):
-					root = cls.SEPARATOR * 2
-					tail = path[2:]
+			if path[0] == separator:
+				# One pass to count the leading separators, the stripped string is the tail in the common cases
+				tail = path.lstrip(separator)
+				leading = len(path) - len(tail)
+				if leading == 1:
+					root = separator
+				elif leading == 2:
+					root = intern(separator * 2)
 				else:
-					root = cls.SEPARATOR
+					# Three or more are a single root, the extra ones are kept as empty components
+					root = separator
 					tail = path[1:]
 			else:
 				root = ''
 				tail = path
-			tail = tail.split(cls.SEPARATOR) if tail else []
+			# Components are interned, sibling paths end up sharing them
+			if not tail:
+				tail = ()
+			elif separator not in tail:
+				# Single component (a plain name), the membership check is cheaper than a split
+				# The tail could still be the argument itself, and str subclasses can't be interned
+				tail = (intern(str(tail)),)
+			else:
+				tail = tuple(map(intern, tail.split(separator)))
 			return '', root, tail
 		else:
-			return '', '', []
+			return '', '', ()
+
+	def is_absolute(self):
+		"""
+		Return True if the path is absolute (has a root). There are no drives here, so the root is enough.
+		"""
+
+		return bool(self.root)
 
 	def as_posix(self):
 		"""
@@ -62,7 +89,8 @@ class PurePosixPath(BaseOSPurePath):
 
 		if not self.is_absolute():
 			raise ValueError("relative path can't be expressed as a file URI")
-		return 'file://' + str(self)
+		# Percent-encoded in a single pass over the filesystem bytes, "/" is left alone
+		return 'file://' + quote_from_bytes(fsencode(str(self)))
 
 
 class PosixPath(BaseOSPath, PurePosixPath):
@@ -6,8 +6,11 @@ This submodule contains the specifics for the Windows systems.
 """
 
 from abc import abstractmethod
+from functools import cached_property, lru_cache
 from logging import getLogger
 import ntpath
+from sys import intern
+from urllib.parse import quote_from_bytes
 
 from ._local import __version__, BaseOSPath, BaseOSPurePath
 
@@ -24,15 +27,20 @@ class PureWindowsPath(BaseOSPurePath):
 	RESERVED_NAMES = frozenset(['CON', 'PRN', 'AUX', 'NUL'] + ['COM{}'.format(i) for i in range(9)] + ['LPT{}'.format(i) for i in range(9)])
 	INVALID_PATH_CHARS = frozenset(('<', '>', ':', '"', '/', '|', '?', '*'))
 	SEPARATOR = '\\'
+	UNC_PREFIX = '\\\\'
+	DEVICE_NAMESPACE_PREFIX = '\\\\.\\'
+	NT_NAMESPACE_PREFIX = '\\\\?\\'
+	NT_UNC_PREFIX = '\\\\?\\UNC\\'
 	parser = ntpath
 
 	@classmethod
+	@lru_cache(maxsize=1024)
 	def _parse_path(cls, path):
 		"""Local parsing logic
 		Should implement whatever logic is needed to parse the provided path string into a tuple (drive, root, tail)
 
 		Drive and/or root could be empty, but both should be strings. Tail should be a sequence (could be empty too).
-		The empty path would yield ('', '', [])
+		The empty path would yield ('', '', ())
 
 		The method should not try to simplify the path (resolve globbing, remove separator repetitions, etc.). The class must be able to recreate the original values, which becomes impossible if any part of it is removed here.
 
@@ -41,50 +49,69 @@ class PureWindowsPath(BaseOSPurePath):
 		- https://learn.microsoft.com/en-us/windows/win32/fileio/maximum-file-path-limitation
 		"""
 
-		path = path.replace('/', cls.SEPARATOR) # This is a weird backwards compatibility reason. At the end of the day it seems that Windows internally converts it to its preferred separator.
-		if path[:1] == cls.SEPARATOR:
-			if path[1:2] == cls.SEPARATOR:
-				if (path[2:3] in ['?','.']) and (path[3:4] == cls.SEPARATOR):
-					# Namespace prefix, e.g. \\?\ or \\.\
-					if path[2:3] == '.':
-						# Win32 Device Namespace, e.g. \\.\COM56
-						return path[:3], path[3], path[4:].split(cls.SEPARATOR)
-					elif path[4:8] == 'UNC' + cls.SEPARATOR:
-						# Win32 UNC drives through WinNT Namespace, e.g. \\?\UNC\server or \\?\UNC\server\share\path\to\somewhere
-						late_path = [part for part in path[8:].split(cls.SEPARATOR)]
-						drive = [part for part in late_path[:2] if part]
-						tail = late_path[2:]
-						if (path[8:] and not drive) or (late_path[1:2] and not late_path[0:1]) or ((len(drive) < 2) and tail):
-							raise ValueError('Invalid drive: {}'.format(late_path[:2]))
-						return path[:8] + cls.SEPARATOR.join(drive), cls.SEPARATOR if tail else '', tail
-					elif path[5:6] == ':' and (path[6:7] == cls.SEPARATOR):
-						# Win32 File through WinNT Namespace, e.g. \\?\X:\Windows
-						return path[:6], path[6:7], path[7:].split(cls.SEPARATOR)
-					else:
-						# WinNT Namespace, e.g. \\?\Device\HarddiskVolume1 or \\?\KernelObjects\Session0
-						cls.INVALID_PATH_CHARS = frozenset()
-						return path[:3], path[3:4], path[4:].split(cls.SEPARATOR)
+		# Drives are interned (like the tail components), there's only a handful of distinct ones
+		separator = cls.SEPARATOR
+		path = path.replace('/', separator) # This is a weird backwards compatibility reason. At the end of the day it seems that Windows internally converts it to its preferred separator.
+		if path.startswith(separator):
+			if path.startswith(cls.DEVICE_NAMESPACE_PREFIX):
+				# Win32 Device Namespace, e.g. \\.\COM56
+				return intern(path[:3]), separator, cls._split_tail(path[4:])
+			elif path.startswith(cls.NT_UNC_PREFIX):
+				# Win32 UNC drives through WinNT Namespace, e.g. \\?\UNC\server or \\?\UNC\server\share\path\to\somewhere
+				late_path = path[8:].split(separator, 2)
+				drive = tuple(filter(None, late_path[:2]))
+				# The separator after the share is the root (even with nothing after it), the rest is a regular tail
+				root = separator if (len(late_path) > 2) else ''
+				tail = cls._split_tail(late_path[2]) if root else ()
+				if (path[8:] and not drive) or (late_path[1:2] and not late_path[0:1]) or ((len(drive) < 2) and root):
+					raise ValueError('Invalid drive: {}'.format(late_path[:2]))
+				return intern(path[:8] + separator.join(drive)), root, tail
+			elif path.startswith(cls.NT_NAMESPACE_PREFIX):
+				if path.startswith(':' + separator, 5):
+					# Win32 File through WinNT Namespace, e.g. \\?\X:\Windows
+					return intern(path[:6]), separator, cls._split_tail(path[7:])
 				else:
-					# UNC drives, e.g. \\server or \\server\share\path\to\somewhere
-					late_path = [part for part in path[2:].split(cls.SEPARATOR)]
-					drive = [part for part in late_path[:2] if part]
-					tail = late_path[2:]
-					if (path[2:] and not drive) or (late_path[1:2] and not late_path[0:1]) or ((len(drive) < 2) and tail):
-						raise ValueError('Invalid drive: {}'.format(late_path[:2]))
-					return cls.SEPARATOR.join(['',''] + drive), cls.SEPARATOR if tail else '', tail
+					# WinNT Namespace, e.g. \\?\Device\HarddiskVolume1 or \\?\KernelObjects\Session0
+					return intern(path[:3]), separator, cls._split_tail(path[4:])
+			elif path.startswith(cls.UNC_PREFIX):
+				# UNC drives, e.g. \\server or \\server\share\path\to\somewhere
+				late_path = path[2:].split(separator, 2)
+				drive = tuple(filter(None, late_path[:2]))
+				# The separator after the share is the root (even with nothing after it), the rest is a regular tail
+				root = separator if (len(late_path) > 2) else ''
+				tail = cls._split_tail(late_path[2]) if root else ()
+				if (path[2:] and not drive) or (late_path[1:2] and not late_path[0:1]) or ((len(drive) < 2) and root):
+					raise ValueError('Invalid drive: {}'.format(late_path[:2]))
+				return intern(separator.join(('', '') + drive)), root, tail
 			else:
 				# Relative path with root, e.g. \Windows
-				return '', path[:1], path[1:].split(cls.SEPARATOR)
-		elif path[1:2] == ':':
-			if path[2:3] == cls.SEPARATOR:
+				return '', separator, cls._split_tail(path[1:])
+		elif path.startswith(':', 1):
+			if path.startswith(separator, 2):
 				# Absolute drive-letter path, e.g. X:\Windows
-				return path[:2], path[2:3], path[3:].split(cls.SEPARATOR)
+				return intern(path[:2]), separator, cls._split_tail(path[3:])
 			else:
 				# Relative path with drive, e.g. X:Windows
-				return path[:2], '', path[2:].split(cls.SEPARATOR)
+				return intern(path[:2]), '', cls._split_tail(path[2:])
 		else:
 			# Relative path, e.g. Windows
-			return '', '', path.split(cls.SEPARATOR)
+			return '', '', cls._split_tail(path)
+
+	@classmethod
+	def _validate_parts(cls, anchor='', *tail):
+		"""Validate the name of the provided tail parts
+		The WinNT namespace (the bare \\?\ anchor) doesn't follow the Win32 naming rules, so only the components and the separator are checked in there. Everything else goes through the regular validation.
+		"""
+
+		if anchor == cls.NT_NAMESPACE_PREFIX:
+			if not cls.INVALID_PATH_COMPONENTS.isdisjoint(tail):
+				raise ValueError('Invalid path component: {}'.format(frozenset(tail) & cls.INVALID_PATH_COMPONENTS))
+			for part in tail:
+				if cls.SEPARATOR in part:
+					raise ValueError('Invalid character(s) in path component: "{}" -> {}'.format(frozenset(cls.SEPARATOR), part))
+			return True
+
+		return super()._validate_parts(anchor, *tail)
 
 	@classmethod
 	def _validate_tail_parts(cls, *tail_parts):
@@ -100,12 +127,27 @@ class PureWindowsPath(BaseOSPurePath):
 
 		return True
 
+	def is_absolute(self):
+		"""
+		Return True if the path is absolute (has both a drive and a root).
+		"""
+
+		return bool(self.drive and self.root)
+
+	@cached_property
+	def _posix_str(self):
+		"""Posix string
+		The string representation of the path with forward (/) slashes. Paths are immutable, so the replacement is done only once.
+		"""
+
+		return str(self).replace(self.SEPARATOR, '/')
+
 	def as_posix(self):
 		"""
 		Return the string representation of the path with forward (/) slashes.
 		"""
 
-		return str(self).replace(self.SEPARATOR, '/')
+		return self._posix_str
 
 	def as_uri(self):
 		"""Return the path as a URI.
@@ -114,17 +156,23 @@ class PureWindowsPath(BaseOSPurePath):
 
 		if not self.is_absolute():
 			raise ValueError("relative path can't be expressed as a file URI")
-		return 'file://' + self.as_posix()
+		# Lone surrogates are valid in a Windows path, they're kept in the encoding like nturl2path does
+		drive, path = self.drive, self._posix_str
+		if drive[1:2] == ':':
+			# Drive letter paths, e.g. file:///C:/Windows (the drive itself is not quoted)
+			return 'file:///' + drive + quote_from_bytes(path[2:].encode('utf-8', 'surrogatepass'))
+		else:
+			# UNC and namespace paths already start with "//", the host goes in the URI authority
+			return 'file:' + quote_from_bytes(path.encode('utf-8', 'surrogatepass'))
 
 	def is_reserved(self):
 		"""
 		Return True if the path contains one of the special names reserved by the system, if any.
+		A pure path can only check the name: the reserved paths (relative and absolute) and the resolution live in the concrete classes. Any extension is ignored, "CON.tar.gz" is as reserved as "CON".
 		"""
 		
-		if self.stem:
-			return (self.stem.upper() in self.RESERVED_NAMES) or (self.with_suffix('') in self.RESERVED_RELATIVE_PATHS) or (self.resolve().with_suffix('') in self.RESERVED_ABSOLUTE_PATHS)
-		else:
-			return False
+		pure_stem = self.pure_stem
+		return bool(pure_stem) and ((pure_stem if self.CASE_SENSITIVE else pure_stem.upper()) in self.RESERVED_NAMES)
 
 
 class WindowsPath(BaseOSPath, PureWindowsPath):
@@ -0,0 +1,176 @@
+#!python
+"""
+Testing the posix.PosixPath filesystem methods
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pathlib_.posix import PosixPath
+
+
+class TestDirectories(TestCase):
+	"""
+	Testing the posix.PosixPath.iterdir and posix.PosixPath.walk methods
+	"""
+
+	def setUp(self):
+		"""
+		A small tree: top/{f, a/{g, b/{h}}, c/, link -> a}
+		"""
+
+		self.tempdir = TemporaryDirectory()
+		self.top = self.tempdir.name
+		os.makedirs(os.path.join(self.top, 'a', 'b'))
+		os.mkdir(os.path.join(self.top, 'c'))
+		for name in ('f', os.path.join('a', 'g'), os.path.join('a', 'b', 'h')):
+			open(os.path.join(self.top, name), 'w').close()
+		os.symlink(os.path.join(self.top, 'a'), os.path.join(self.top, 'link'))
+
+	def tearDown(self):
+		"""
+		Cleanup
+		"""
+
+		self.tempdir.cleanup()
+
+	def _walk(self, **kwargs):
+		"""
+		Run walk and turn the results into (relative dir, sorted dirnames, sorted filenames)
+		"""
+
+		return [(os.path.relpath(str(path), self.top), sorted(dirnames), sorted(filenames)) for path, dirnames, filenames in PosixPath(self.top).walk(**kwargs)]
+
+	def test_iterdir(self):
+		"""
+		Listing a directory with posix.PosixPath.iterdir
+		"""
+
+		P = PosixPath
+		children = list(P(self.top).iterdir())
+		self.assertEqual(sorted(children), sorted(P(self.top, name) for name in ('a', 'c', 'f', 'link')))
+		for child in children:
+			self.assertIs(type(child), P)
+		self.assertEqual(list(P(self.top, 'c').iterdir()), [])
+		with self.assertRaises(FileNotFoundError):
+			list(P(self.top, 'missing').iterdir())
+
+	def test_walk_top_down(self):
+		"""
+		Directories are yielded before their children with posix.PosixPath.walk(top_down=True)
+		"""
+
+		result = self._walk()
+		self.assertEqual(sorted(result), [
+			('.', ['a', 'c'], ['f', 'link']),
+			('a', ['b'], ['g']),
+			(os.path.join('a', 'b'), [], ['h']),
+			('c', [], []),
+		])
+		order = [path for path, _, _ in result]
+		self.assertEqual(order[0], '.')
+		self.assertLess(order.index('a'), order.index(os.path.join('a', 'b')))
+
+	def test_walk_bottom_up(self):
+		"""
+		Directories are yielded after their children with posix.PosixPath.walk(top_down=False)
+		"""
+
+		result = self._walk(top_down=False)
+		order = [path for path, _, _ in result]
+		self.assertEqual(sorted(order), ['.', 'a', os.path.join('a', 'b'), 'c'])
+		self.assertEqual(order[-1], '.')
+		self.assertLess(order.index(os.path.join('a', 'b')), order.index('a'))
+
+	def test_walk_prune(self):
+		"""
+		Pruning dirnames in place during posix.PosixPath.walk(top_down=True)
+		"""
+
+		seen = []
+		for path, dirnames, filenames in PosixPath(self.top).walk():
+			seen.append(os.path.relpath(str(path), self.top))
+			if 'a' in dirnames:
+				dirnames.remove('a')
+		self.assertEqual(sorted(seen), ['.', 'c'])
+
+	def test_walk_on_error(self):
+		"""
+		The on_error callback of posix.PosixPath.walk
+		"""
+
+		errors = []
+		self.assertEqual(list(PosixPath(self.top, 'missing').walk(on_error=errors.append)), [])
+		self.assertEqual(len(errors), 1)
+		self.assertIsInstance(errors[0], FileNotFoundError)
+		# Without a callback the error is ignored
+		self.assertEqual(list(PosixPath(self.top, 'missing').walk()), [])
+
+	def test_walk_symlinks(self):
+		"""
+		Symlinked directories with posix.PosixPath.walk
+		"""
+
+		result = self._walk()
+		self.assertIn(('.', ['a', 'c'], ['f', 'link']), result)
+		self.assertNotIn('link', [path for path, _, _ in result])
+		result = self._walk(follow_symlinks=True)
+		self.assertIn(('.', ['a', 'c', 'link'], ['f']), result)
+		self.assertIn(('link', ['b'], ['g']), result)
+		self.assertIn((os.path.join('link', 'b'), [], ['h']), result)
+
+
+class TestFileType(TestCase):
+	"""
+	Testing the posix.PosixPath.is_symlink and posix.PosixPath.is_mount methods
+	"""
+
+	def setUp(self):
+		"""
+		A file, a directory, a symlink to the file and a dangling symlink
+		"""
+
+		self.tempdir = TemporaryDirectory()
+		self.top = self.tempdir.name
+		self.file = os.path.join(self.top, 'file')
+		open(self.file, 'w').close()
+		self.directory = os.path.join(self.top, 'directory')
+		os.mkdir(self.directory)
+		self.link = os.path.join(self.top, 'link')
+		os.symlink(self.file, self.link)
+		self.dangling = os.path.join(self.top, 'dangling')
+		os.symlink(os.path.join(self.top, 'missing'), self.dangling)
+
+	def tearDown(self):
+		"""
+		Cleanup
+		"""
+
+		self.tempdir.cleanup()
+
+	def test_is_symlink(self):
+		"""
+		Symlinks are detected without following them by posix.PosixPath.is_symlink
+		"""
+
+		P = PosixPath
+		self.assertTrue(P(self.link).is_symlink())
+		self.assertTrue(P(self.link).is_file())
+		self.assertTrue(P(self.dangling).is_symlink())
+		self.assertFalse(P(self.dangling).exists())
+		self.assertFalse(P(self.file).is_symlink())
+		self.assertFalse(P(self.directory).is_symlink())
+		self.assertFalse(P(self.top, 'missing').is_symlink())
+
+	def test_is_mount(self):
+		"""
+		Mount points with posix.PosixPath.is_mount
+		"""
+
+		P = PosixPath
+		self.assertTrue(P('/').is_mount())
+		self.assertFalse(P(self.directory).is_mount())
+		self.assertFalse(P(self.file).is_mount())
+		self.assertFalse(P(self.dangling).is_mount())
+		self.assertFalse(P(self.top, 'missing').is_mount())
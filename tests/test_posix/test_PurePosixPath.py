@@ -3,6 +3,8 @@
 Testing the posix.PurePosixPath class magic methods
 """
 
+import os
+import pickle
 from unittest import TestCase
 
 from pathlib_.posix import PurePosixPath
@@ -42,6 +44,55 @@ class TestNew(TestCase):
 		P('a/b/c')
 		P('/a/b/c')
 	
+	def test_constructor_empty_segments(self):
+		"""
+		Empty string arguments are ignored by posix.PurePosixPath.__new__
+		"""
+		
+		P = self.cls
+		self.assertEqual(P('a', '', 'b'), P('a/b'))
+		self.assertEqual(str(P('', 'a', '')), 'a')
+		self.assertEqual(P('', ''), P())
+	
+	def test_constructor_path_segments(self):
+		"""
+		Already parsed segments are spliced by posix.PurePosixPath.__new__
+		"""
+		
+		P = self.cls
+		self.assertEqual(P(P('/usr'), 'local'), P('/usr/local'))
+		self.assertEqual(P(P('/usr')).root, '/')
+		self.assertEqual(P('a', P('b/c'), 'd'), P('a/b/c/d'))
+		self.assertEqual(P('a', P('/b'), 'c'), P('/b/c'))
+		self.assertEqual(P(P('//a'), 'b').root, '//')
+
+	def test_constructor_string_segments(self):
+		"""
+		String segments are parsed one by one by posix.PurePosixPath.__new__
+		"""
+
+		P = self.cls
+		self.assertEqual(str(P('/', 'usr')), '/usr')
+		self.assertEqual(P('/', 'usr').root, '/')
+		self.assertEqual(P('a', '/b', 'c'), P('/b/c'))
+		self.assertEqual(P('a/', 'b').parts, ('a', '', 'b'))
+
+	def test_constructor_str_subclass(self):
+		"""
+		String subclasses are accepted by posix.PurePosixPath.__new__
+		"""
+
+		class S(str):
+			pass
+
+		P = self.cls
+		self.assertEqual(P(S('a')), P('a'))
+		self.assertEqual(P('x', S('a')), P('x/a'))
+		self.assertEqual(P(S('/a/b')), P('/a/b'))
+		self.assertIs(type(P(S('a')).name), str)
+		self.assertIs(type(str(P(S('/a/b')))), str)
+		self.assertIs(type(os.fspath(P(S('/a/b')))), str)
+
 	def test_div_common(self):
 		"""
 		Running posix.PurePosixPath.__truediv__ through upstream tests
@@ -176,7 +227,40 @@ class TestNew(TestCase):
 			par[-4]
 		with self.assertRaises(IndexError):
 			par[3]
-	
+
+	def test_parents_contains(self):
+		"""
+		Membership checks on posix.PurePosixPath.parents
+		"""
+
+		P = self.cls
+		par = P('/a/b/c').parents
+		self.assertIn(P('/a/b'), par)
+		self.assertIn(P('/'), par)
+		self.assertNotIn(P('/a/b/c'), par)
+		self.assertNotIn(P(''), par)
+		self.assertNotIn(P('a'), par)
+		self.assertNotIn('/a', par)
+		par = P('a/b').parents
+		self.assertIn(P('a'), par)
+		self.assertIn(P(''), par)
+		self.assertNotIn(P('/'), par)
+
+	def test_pickling(self):
+		"""
+		Round-tripping posix.PurePosixPath through pickle
+		"""
+
+		P = self.cls
+		for path in ('', 'a/b', '/a/b', '//a/b', 'a//b/', '///a'):
+			p = P(path)
+			for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+				pp = pickle.loads(pickle.dumps(p, proto))
+				self.assertIs(pp.__class__, p.__class__)
+				self.assertEqual(pp, p)
+				self.assertEqual(pp.parts, p.parts)
+				self.assertEqual(str(pp), str(p))
+
 	def test_drive_common(self):
 		"""
 		Running posix.PurePosixPath.drive through upstream tests
@@ -332,4 +416,18 @@ class TestNew(TestCase):
 		self.assertEqual(P('a/..d.o.t..').stem, '..d.o.t..')
 		self.assertEqual(P('a/inn.er..dots').stem, 'inn.er.')
 		self.assertEqual(P('photo').stem, 'photo')
-		self.assertEqual(P('photo.jpg').stem, 'photo')
\ No newline at end of file
+		self.assertEqual(P('photo.jpg').stem, 'photo')
+
+	def test_as_uri(self):
+		"""
+		File URIs from posix.PurePosixPath.as_uri
+		"""
+
+		P = self.cls
+		self.assertEqual(P('/').as_uri(), 'file:///')
+		self.assertEqual(P('/a/b.c').as_uri(), 'file:///a/b.c')
+		self.assertEqual(P('/a b/c%d').as_uri(), 'file:///a%20b/c%25d')
+		self.assertEqual(P('/a/b\xe9').as_uri(), 'file:///a/b%C3%A9')
+		self.assertEqual(P('//a/b').as_uri(), 'file:////a/b')
+		self.assertRaises(ValueError, P('a').as_uri)
+		self.assertRaises(ValueError, P('').as_uri)
@@ -36,6 +36,17 @@ class TestPurePosixPathRelativeTo(TestCase):
 		expected_result = PurePosixPath('../../../foo/bar/baz')
 		self.assertEqual(PurePosixPath('foo/bar/baz').relative_to('spam/spam/lobster', walk_up=True), expected_result)
 	
+	def test_walk_up_ignores_empty_and_current(self):
+		"""
+		Test "PurePosixPath.relative_to" walking up from paths with empty and "." components
+		"""
+		
+		P = self.cls
+		self.assertEqual(P('/a').relative_to('/a/./b', walk_up=True), P('..'))
+		self.assertEqual(P('a').relative_to('a/b/', walk_up=True), P('..'))
+		self.assertEqual(P('/').relative_to('///', walk_up=True), P(''))
+		self.assertEqual(P('/a/b').relative_to('/a/', walk_up=True), P('b'))
+	
 	def test_relative_to_common(self):
 		P = self.cls
 		p = P('a/b')
@@ -57,8 +68,8 @@ class TestPurePosixPathRelativeTo(TestCase):
 		self.assertEqual(p.relative_to('a/b', walk_up=True), P(''))
 		self.assertEqual(p.relative_to(P('a/c'), walk_up=True), P('../b'))
 		self.assertEqual(p.relative_to('a/c', walk_up=True), P('../b'))
-		# self.assertEqual(p.relative_to(P('a/b/c'), walk_up=True), P('..')) # ToDo: Fix
-		# self.assertEqual(p.relative_to('a/b/c', walk_up=True), P('..')) # ToDo: Fix
+		self.assertEqual(p.relative_to(P('a/b/c'), walk_up=True), P('..'))
+		self.assertEqual(p.relative_to('a/b/c', walk_up=True), P('..'))
 		self.assertEqual(p.relative_to(P('c'), walk_up=True), P('../a/b'))
 		self.assertEqual(p.relative_to('c', walk_up=True), P('../a/b'))
 		# Unrelated paths.
@@ -71,8 +82,8 @@ class TestPurePosixPathRelativeTo(TestCase):
 		self.assertRaises(ValueError, p.relative_to, P("/a/.."))
 		self.assertRaises(ValueError, p.relative_to, P('/'), walk_up=True)
 		self.assertRaises(ValueError, p.relative_to, P('/a'), walk_up=True)
-		# self.assertRaises(ValueError, p.relative_to, P("../a"), walk_up=True) # ToDo: Fix
-		# self.assertRaises(ValueError, p.relative_to, P("a/.."), walk_up=True) # ToDo: Fix
+		self.assertRaises(ValueError, p.relative_to, P("../a"), walk_up=True)
+		self.assertRaises(ValueError, p.relative_to, P("a/.."), walk_up=True)
 		self.assertRaises(ValueError, p.relative_to, P("/a/.."), walk_up=True)
 		p = P('/a/b')
 		self.assertEqual(p.relative_to(P('/')), P('a/b'))
@@ -91,8 +102,8 @@ class TestPurePosixPathRelativeTo(TestCase):
 		self.assertEqual(p.relative_to('/a/b', walk_up=True), P(''))
 		self.assertEqual(p.relative_to(P('/a/c'), walk_up=True), P('../b'))
 		self.assertEqual(p.relative_to('/a/c', walk_up=True), P('../b'))
-		# self.assertEqual(p.relative_to(P('/a/b/c'), walk_up=True), P('..')) # ToDo: Fix
-		# self.assertEqual(p.relative_to('/a/b/c', walk_up=True), P('..')) # ToDo: Fix
+		self.assertEqual(p.relative_to(P('/a/b/c'), walk_up=True), P('..'))
+		self.assertEqual(p.relative_to('/a/b/c', walk_up=True), P('..'))
 		self.assertEqual(p.relative_to(P('/c'), walk_up=True), P('../a/b'))
 		self.assertEqual(p.relative_to('/c', walk_up=True), P('../a/b'))
 		# Unrelated paths.
@@ -109,4 +120,4 @@ class TestPurePosixPathRelativeTo(TestCase):
 		self.assertRaises(ValueError, p.relative_to, P('a'), walk_up=True)
 		self.assertRaises(ValueError, p.relative_to, P("../a"), walk_up=True)
 		self.assertRaises(ValueError, p.relative_to, P("a/.."), walk_up=True)
-		# self.assertRaises(ValueError, p.relative_to, P("/a/.."), walk_up=True) # ToDo: Fix
\ No newline at end of file
+		self.assertRaises(ValueError, p.relative_to, P("/a/.."), walk_up=True)
\ No newline at end of file
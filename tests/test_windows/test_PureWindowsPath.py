@@ -0,0 +1,133 @@
+#!python
+"""
+Testing the windows.PureWindowsPath class magic methods
+"""
+
+from unittest import TestCase
+
+from pathlib_.windows import PureWindowsPath
+
+
+class TestNew(TestCase):
+	"""
+	Testing the windows.PureWindowsPath.__new__ class method
+	"""
+	
+	@classmethod
+	def setUpClass(cls):
+		"""
+		Initial values
+		"""
+		
+		cls.cls = PureWindowsPath
+
+	def test_constructor_string_segments(self):
+		"""
+		String segments are parsed one by one by windows.PureWindowsPath.__new__
+		"""
+
+		P = self.cls
+		self.assertEqual(str(P('C:\\a', 'b')), 'C:\\a\\b')
+		# A root without a drive keeps the current drive
+		self.assertEqual(str(P('C:\\a', '\\b')), 'C:\\b')
+		self.assertEqual(P('C:\\a', '\\b').drive, 'C:')
+		self.assertEqual(str(P('a', '\\b')), '\\b')
+		self.assertEqual(str(P('//server/share/a', '\\b')), '\\\\server\\share\\b')
+		# The same drive (compared case-insensitively) just appends, with the latest spelling
+		self.assertEqual(str(P('c:\\a', 'C:b')), 'C:\\a\\b')
+		self.assertEqual(str(P('C:a', 'C:\\b')), 'C:\\b')
+		# A different drive replaces everything
+		self.assertEqual(str(P('C:\\a', 'D:b')), 'D:b')
+		self.assertEqual(str(P('c:/a', 'd:/b', 'e')), 'd:\\b\\e')
+		# A UNC share is absolute, even when it was parsed without a root
+		self.assertEqual(str(P('//srv/shr', 'a')), '\\\\srv\\shr\\a')
+		self.assertEqual(P('//srv/shr', 'a').parts, ('\\\\srv\\shr\\', 'a'))
+		self.assertEqual(P('//srv/shr', 'a'), P(str(P('//srv/shr', 'a'))))
+		self.assertEqual(str(P('//?/UNC/srv/shr', 'a')), '\\\\?\\UNC\\srv\\shr\\a')
+		self.assertEqual(P('//?/UNC/srv/shr', 'a').root, '\\')
+		self.assertEqual(P('//srv/shr') / 'a', P('//srv/shr', 'a'))
+		self.assertEqual(P('//srv/shr').joinpath('a', 'b'), P('//srv/shr/a/b'))
+		# The separator after the share is its root, like the one after a drive letter
+		self.assertEqual(P('//srv/shr/').parts, ('\\\\srv\\shr\\',))
+		self.assertEqual(P('//?/UNC/srv/shr/').parts, ('\\\\?\\UNC\\srv\\shr\\',))
+		self.assertEqual(str(P('//srv/shr/') / 'a'), '\\\\srv\\shr\\a')
+		self.assertEqual(str(P('//?/UNC/srv/shr/', 'a')), '\\\\?\\UNC\\srv\\shr\\a')
+
+	def test_constructor_path_segments(self):
+		"""
+		Already parsed segments are spliced by windows.PureWindowsPath.__new__
+		"""
+
+		P = self.cls
+		self.assertEqual(str(P(P('C:\\a'), P('b'))), 'C:\\a\\b')
+		self.assertEqual(str(P(P('C:\\a'), P('\\b'))), 'C:\\b')
+		self.assertEqual(str(P(P('c:\\a'), P('C:b'))), 'C:\\a\\b')
+		self.assertEqual(str(P(P('C:\\a'), P('D:b'))), 'D:b')
+		self.assertEqual(str(P('C:\\a', P('\\b'), 'c')), 'C:\\b\\c')
+		self.assertEqual(str(P(P('//srv/shr'), P('a'))), '\\\\srv\\shr\\a')
+		self.assertEqual(P(P('//srv/shr'), P('a')), P('//srv/shr/a'))
+
+	def test_as_uri(self):
+		"""
+		File URIs from windows.PureWindowsPath.as_uri
+		"""
+
+		P = self.cls
+		self.assertEqual(P('c:/').as_uri(), 'file:///c:/')
+		self.assertEqual(P('c:/a/b.c').as_uri(), 'file:///c:/a/b.c')
+		self.assertEqual(P('c:/a b/c%d').as_uri(), 'file:///c:/a%20b/c%25d')
+		self.assertEqual(P('c:/a/b\xe9').as_uri(), 'file:///c:/a/b%C3%A9')
+		self.assertEqual(P('c:/a\udcff').as_uri(), 'file:///c:/a%ED%B3%BF')
+		self.assertEqual(P('//server/share/a\udcff').as_uri(), 'file://server/share/a%ED%B3%BF')
+		self.assertEqual(P('//server/share/').as_uri(), 'file://server/share/')
+		self.assertEqual(P('//server/share/a b.c').as_uri(), 'file://server/share/a%20b.c')
+		self.assertRaises(ValueError, P('a').as_uri)
+		self.assertRaises(ValueError, P('c:a').as_uri)
+		self.assertRaises(ValueError, P('\\a').as_uri)
+
+	def test_nt_namespace_validation(self):
+		"""
+		The WinNT namespace exemption of windows.PureWindowsPath doesn't leak into later paths
+		"""
+
+		P = self.cls
+		invalid_path_chars = P.INVALID_PATH_CHARS
+		p = P('\\\\?\\Device\\HarddiskVolume1\\a:b')
+		self.assertEqual(p.drive, '\\\\?')
+		self.assertEqual(p.tail, ('Device', 'HarddiskVolume1', 'a:b'))
+		self.assertEqual(P.INVALID_PATH_CHARS, invalid_path_chars)
+		self.assertRaises(ValueError, P, 'a*b')
+		self.assertRaises(ValueError, P, 'c:/x|y')
+		self.assertRaises(ValueError, P, 'a<b')
+
+	def test_nt_namespace_joinpath(self):
+		"""
+		The WinNT namespace exemption of windows.PureWindowsPath applies to the joined segments too
+		"""
+
+		P = self.cls
+		p = P('\\\\?\\Device')
+		self.assertEqual(p.joinpath('a*b'), P('\\\\?\\Device', 'a*b'))
+		self.assertEqual(p / 'a*b', P('\\\\?\\Device\\a*b'))
+		self.assertEqual((p / 'x').with_name('a*b'), p / 'a*b')
+		self.assertEqual((p / 'x\\a|b').tail, ('Device', 'x', 'a|b'))
+		self.assertRaises(ValueError, P('c:/').joinpath, 'a*b')
+		self.assertRaises(ValueError, P('c:/').joinpath, 'x\\a|b')
+		self.assertRaises(ValueError, P('a').__truediv__, 'a<b')
+
+	def test_is_reserved(self):
+		"""
+		Reserved names with windows.PureWindowsPath.is_reserved
+		"""
+
+		P = self.cls
+		self.assertTrue(P('CON').is_reserved())
+		self.assertTrue(P('con.txt').is_reserved())
+		self.assertTrue(P('CON.tar.gz').is_reserved())
+		self.assertTrue(P('a/NUL').is_reserved())
+		self.assertTrue(P('c:/a/lpt1.log').is_reserved())
+		self.assertFalse(P('CONX').is_reserved())
+		self.assertFalse(P('a/CONX.txt').is_reserved())
+		self.assertFalse(P('NUL/a').is_reserved())
+		self.assertFalse(P('').is_reserved())
+		self.assertFalse(P('c:/').is_reserved())